@@ -16,8 +16,10 @@ import omni.ext
 import omni.kit.ui
 
 from .actiongraph_no_code_ui_example import ActionGraphNoCodeUiExample
+from .performance_hud_example import PerformanceHudExample
 from .prim_maker_example import PrimMakerExample
 from .prim_transform_example import PrimTransformExample
+from .stage_event_dispatcher import StageEventDispatcher
 from .widget_gallery_example import WidgetGalleryExample
 
 
@@ -29,11 +31,13 @@ class XRSceneViewExampleExtension(omni.ext.IExt):
     def __init__(self):
         super().__init__()
         self._ext_id: Optional[str] = None
+        self._stage_event_dispatcher: Optional[StageEventDispatcher] = None
 
         self._widget_gallery_example: Optional[WidgetGalleryExample] = None
         self._prim_transform_example: Optional[PrimTransformExample] = None
         self._prim_maker_example: Optional[PrimMakerExample] = None
         self._ag_no_code_ui_example: Optional[ActionGraphNoCodeUiExample] = None
+        self._performance_hud_example: Optional[PerformanceHudExample] = None
 
     def on_startup(self, ext_id: str) -> None:
         """Called when the extension is starting up.
@@ -42,11 +46,13 @@ class XRSceneViewExampleExtension(omni.ext.IExt):
         """
         carb.log_info("Sample USD UI scene extension loading")
         self._ext_id = ext_id
+        self._stage_event_dispatcher = StageEventDispatcher()
 
         self._widget_gallery_example = WidgetGalleryExample(ext_id)
-        self._prim_transform_example = PrimTransformExample(ext_id)
+        self._prim_transform_example = PrimTransformExample(ext_id, self._stage_event_dispatcher)
         self._prim_maker_example = PrimMakerExample(ext_id)
         self._ag_no_code_ui_example = ActionGraphNoCodeUiExample(ext_id)
+        self._performance_hud_example = PerformanceHudExample(ext_id)
 
     def on_shutdown(self) -> None:
         """Called when the extension is shutting down."""
@@ -64,3 +70,11 @@ class XRSceneViewExampleExtension(omni.ext.IExt):
         if self._ag_no_code_ui_example:
             self._ag_no_code_ui_example.destroy()
             self._ag_no_code_ui_example = None
+
+        if self._performance_hud_example:
+            self._performance_hud_example.destroy()
+            self._performance_hud_example = None
+
+        if self._stage_event_dispatcher:
+            self._stage_event_dispatcher.destroy()
+            self._stage_event_dispatcher = None
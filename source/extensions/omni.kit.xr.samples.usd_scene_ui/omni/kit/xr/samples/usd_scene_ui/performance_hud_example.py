@@ -0,0 +1,170 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+
+__all__ = ["PerformanceHudExample"]
+
+from typing import Dict, Optional
+
+import omni.kit.app
+from carb.events import IEvent, ISubscription
+from omni import ui
+from omni.kit.xr.core import XREditorMenuToggleItem
+from omni.kit.xr.scene_view.utils import UiContainer, WidgetComponent
+from omni.kit.xr.scene_view.utils.spatial_source import SpatialSource
+from pxr import Gf
+
+from .scene_ui_stats import StatsSampler, get_scene_ui_stats
+
+PERFORMANCE_HUD_EXAMPLE_MENU_PATH: str = "Examples/(XR UI) Performance HUD"
+PERFORMANCE_HUD_EXAMPLE_NAME: str = "Performance HUD"
+# How often the HUD text is refreshed. Frame times are still accumulated every frame.
+REFRESH_INTERVAL_SECONDS: float = 0.5
+
+
+class PerformanceHudWidget(ui.Widget):
+    """
+    Displays the frame time, the number of active scene UI containers, UI updates per second, the number of rebuilds
+    avoided and the time each example spends in its callbacks. UI updates are the widget changes examples make from
+    their callbacks, not the per-frame redraws of widgets using UpdatePolicy.ALWAYS.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self._frame_time_label: Optional[ui.Label] = None
+        self._containers_label: Optional[ui.Label] = None
+        self._ui_updates_label: Optional[ui.Label] = None
+        self._rebuilds_avoided_label: Optional[ui.Label] = None
+        self._callbacks_label: Optional[ui.Label] = None
+        self._build_ui()
+
+    def set_values(
+        self,
+        frame_time_ms: float,
+        active_containers: int,
+        ui_updates_per_second: float,
+        rebuilds_avoided: int,
+        callback_ms: Dict[str, float],
+    ):
+        self._frame_time_label.text = f"Frame: {frame_time_ms:.2f} ms ({1000.0 / max(frame_time_ms, 1e-3):.0f} fps)"
+        self._containers_label.text = f"Scene UI containers: {active_containers}"
+        self._ui_updates_label.text = f"UI updates: {ui_updates_per_second:.1f} /s"
+        self._rebuilds_avoided_label.text = f"Rebuilds avoided: {rebuilds_avoided}"
+        self._callbacks_label.text = "\n".join(
+            f"{example}: {milliseconds:.3f} ms/s" for example, milliseconds in sorted(callback_ms.items())
+        )
+
+    def _build_ui(self):
+        with ui.ZStack():
+            ui.Rectangle(style={"Rectangle": {"background_color": 0xC0222222, "border_radius": 3}})
+
+            with ui.VStack(style={"font_size": 20, "margin": 4}):
+                self._frame_time_label = ui.Label("Frame: -", height=0)
+                self._containers_label = ui.Label("Scene UI containers: -", height=0)
+                self._ui_updates_label = ui.Label("UI updates: -", height=0)
+                self._rebuilds_avoided_label = ui.Label("Rebuilds avoided: -", height=0)
+                ui.Label("Callback time:", height=0)
+                self._callbacks_label = ui.Label("", alignment=ui.Alignment.LEFT_TOP, style={"font_size": 16})
+
+
+class PerformanceHudExample:
+    """
+    This example shows a camera facing HUD with the cost of the scene UI, so that a layout can be tuned from
+    inside the headset.
+
+    Every frame only adds the frame's delta time to a running total. The text is rebuilt every
+    REFRESH_INTERVAL_SECONDS from the counters the other examples report into `SceneUiStats`.
+    """
+
+    def __init__(self, ext_id: str):
+        self._widget_container: Optional[UiContainer] = None
+        self._widget_component: Optional[WidgetComponent] = None
+        self._update_sub: Optional[ISubscription] = None
+        self._sampler: Optional[StatsSampler] = None
+
+        self._elapsed = 0.0
+        self._frames = 0
+
+        self._example_menu_item = XREditorMenuToggleItem(
+            ext_id, PERFORMANCE_HUD_EXAMPLE_MENU_PATH, self._toggle_example, value=False
+        )
+
+    def destroy(self):
+        self._hide()
+        self._example_menu_item = None
+
+    def _toggle_example(self, _menu_path: str, should_show: bool) -> None:
+        """
+        Toggle the example UI widget visible.
+
+        Args:
+            _menu_path: (Unused) The string-path of the menu being toggled
+            should_show: Whether the UI should be shown or hidden
+        """
+        if should_show:
+            self._show()
+        else:
+            self._hide()
+
+    def _show(self):
+        self._widget_component = WidgetComponent(PerformanceHudWidget, width=400, height=340, resolution_scale=2)
+
+        # Placed above and to the right of the gallery, facing the camera.
+        self._widget_container = UiContainer(
+            self._widget_component,
+            space_stack=[
+                SpatialSource.new_translation_source(Gf.Vec3d(600, 400, 0)),
+                SpatialSource.new_look_at_camera_source(),
+            ],
+        )
+        get_scene_ui_stats().container_added(PERFORMANCE_HUD_EXAMPLE_NAME)
+
+        self._sampler = StatsSampler(get_scene_ui_stats())
+        self._sampler.sample()
+        self._elapsed = 0.0
+        self._frames = 0
+        self._update_sub = (
+            omni.kit.app.get_app()
+            .get_update_event_stream()
+            .create_subscription_to_pop(self._on_update, name="Performance HUD Example frame time")
+        )
+
+    def _hide(self):
+        if self._update_sub:
+            self._update_sub.unsubscribe()
+            self._update_sub = None
+
+        if self._widget_container:
+            self._widget_container.root.clear()
+            self._widget_container = None
+            get_scene_ui_stats().container_removed(PERFORMANCE_HUD_EXAMPLE_NAME)
+
+        self._widget_component = None
+        self._sampler = None
+
+    def _on_update(self, event: IEvent) -> None:
+        self._elapsed += event.payload["dt"]
+        self._frames += 1
+        if self._elapsed < REFRESH_INTERVAL_SECONDS:
+            return
+
+        stats = get_scene_ui_stats()
+        with stats.timed(PERFORMANCE_HUD_EXAMPLE_NAME):
+            ui_updates_per_second, callback_ms = self._sampler.sample()
+            widget = self._widget_component.widget if self._widget_component else None
+            if widget:
+                widget.set_values(
+                    self._elapsed * 1000.0 / self._frames,
+                    stats.active_containers,
+                    ui_updates_per_second,
+                    stats.rebuilds_avoided,
+                    callback_ms,
+                )
+
+        self._elapsed = 0.0
+        self._frames = 0
@@ -21,7 +21,10 @@ from omni.kit.xr.scene_view.utils.manipulator_components.widget_component import
 from omni.kit.xr.scene_view.utils.ui_container import UiContainer
 from omni.ui import Menu, color, scene
 
+from .scene_ui_stats import get_scene_ui_stats
+
 PRIM_MAKER_EXAMPLE_MENU_PATH: str = "Examples/(XR UI) Prim Maker"
+PRIM_MAKER_EXAMPLE_NAME: str = "Prim Maker"
 EditorMenuType = Menu | EditorMenu
 
 
@@ -130,15 +133,16 @@ class PrimMakerExampleUI(ui.Widget):
         if not self._x_slider_model or not self._y_slider_model or not self._z_slider_model:
             return
 
-        x = self._x_slider_model.as_float
-        y = self._y_slider_model.as_float
-        z = self._z_slider_model.as_float
+        with get_scene_ui_stats().timed(PRIM_MAKER_EXAMPLE_NAME):
+            x = self._x_slider_model.as_float
+            y = self._y_slider_model.as_float
+            z = self._z_slider_model.as_float
 
-        omni.kit.commands.execute(
-            "CreateMeshPrimWithDefaultXform",
-            prim_type=prim_type.name,
-            object_origin=[x, y, z],
-        )
+            omni.kit.commands.execute(
+                "CreateMeshPrimWithDefaultXform",
+                prim_type=prim_type.name,
+                object_origin=[x, y, z],
+            )
 
 
 class PrimMakerExample:
@@ -173,7 +177,9 @@ class PrimMakerExample:
             widget_component.add_child(translate_handle_component, Area2DComponent.TOP)
 
             self.ui_container = UiContainer(widget_component)
+            get_scene_ui_stats().container_added(PRIM_MAKER_EXAMPLE_NAME)
         else:
             if self.ui_container:
                 self.ui_container.root.clear()
                 self.ui_container = None
+                get_scene_ui_stats().container_removed(PRIM_MAKER_EXAMPLE_NAME)
@@ -10,10 +10,11 @@ __all__ = ["PrimTransformExample"]
 
 import weakref
 
+import carb
 import carb.events
 import omni
 import omni.kit.app as app
-from carb.events import ISubscription
+from carb.events import IEvent
 from omni import ui
 from omni.kit.property.transform.scripts.transform_widget import TransformAttributeWidget
 from omni.kit.property.usd.prim_selection_payload import PrimSelectionPayload
@@ -24,7 +25,12 @@ from omni.ui import color as cl
 from omni.ui import scene
 from pxr import Gf, Sdf, Usd, UsdGeom
 
+from .scene_ui_stats import get_scene_ui_stats
+from .selection_tracker import SelectionTracker
+from .stage_event_dispatcher import StageEventDispatcher, StageEventRegistration
+
 PRIM_TRANSFORM_EXAMPLE_MENU_PATH: str = "Examples/(XR UI) Prim Transform"
+PRIM_TRANSFORM_EXAMPLE_NAME: str = "Prim Transform"
 NOTHING_SELECTED_TEXT = "...no prim selected..."
 # The distance to raise above the top of the object's bounding box
 TOP_OFFSET = 150
@@ -119,14 +125,16 @@ class PrimTransformExample:
     This example shows how one can attach camera facing scene ui to the selected prim.
     """
 
-    def __init__(self, ext_id: str):
+    def __init__(self, ext_id: str, stage_event_dispatcher: StageEventDispatcher):
+        self._stage_event_dispatcher = stage_event_dispatcher
         self._example_menu_item = XREditorMenuToggleItem(
             ext_id, PRIM_TRANSFORM_EXAMPLE_MENU_PATH, self._toggle_example, value=False
         )
 
         self._widget_container: UiContainer[PrimInfoWidget] | None = None
         self._selected_prim: Usd.Prim | None = None
-        self._stage_event_delegate: ISubscription | None = None
+        self._selection_changed_registration: StageEventRegistration | None = None
+        self._selection_tracker: SelectionTracker | None = None
 
     def destroy(self):
         self._hide()
@@ -147,38 +155,45 @@ class PrimTransformExample:
 
     def _show(self):
         self._usd_context = omni.usd.get_context()
-        self._stage_event_delegate = self._usd_context.get_stage_event_stream().create_subscription_to_pop(
-            self._on_stage_event,
-            name="Stage event updates for Prim Info UI Example",
+        self._selection_tracker = SelectionTracker(self._stage_event_dispatcher)
+        self._selection_changed_registration = self._stage_event_dispatcher.register(
+            omni.usd.StageEventType.SELECTION_CHANGED, self._on_selection_changed
         )
 
         selected_paths = self._usd_context.get_selection().get_selected_prim_paths()
-        if len(selected_paths) > 0:
-            self._on_prim_selection_changed(Sdf.Path(selected_paths[0]))
+        if self._selection_tracker.update_from_selected_paths(selected_paths):
+            self._on_prim_selection_changed(self._selection_tracker.path)
 
     def _hide(self):
         self._app_update_sub = None
 
-        if self._stage_event_delegate:
-            self._stage_event_delegate.unsubscribe()
+        if self._selection_changed_registration:
+            self._selection_changed_registration.unsubscribe()
+            self._selection_changed_registration = None
+
+        if self._selection_tracker:
+            rebuilds_avoided = self._selection_tracker.rebuilds_avoided
+            carb.log_info(f"Prim Transform Example avoided {rebuilds_avoided} rebuilds for unchanged selections")
+            self._selection_tracker.destroy()
+            self._selection_tracker = None
 
         if self._widget_container:
             self._widget_container.root.clear()
             self._widget_container = None
+            get_scene_ui_stats().container_removed(PRIM_TRANSFORM_EXAMPLE_NAME)
 
-    def _on_stage_event(self, event) -> None:
-        if event.type == int(omni.usd.StageEventType.SELECTION_CHANGED):
+    def _on_selection_changed(self, _event: IEvent) -> None:
+        with get_scene_ui_stats().timed(PRIM_TRANSFORM_EXAMPLE_NAME):
             selected_paths = self._usd_context.get_selection().get_selected_prim_paths()
-            path = Sdf.Path(selected_paths[0]) if len(selected_paths) > 0 else None
-            self._on_prim_selection_changed(path)
-
-    def _on_prim_selection_changed(self, prim_path: Sdf.Path) -> None:
-        if str(self._selected_prim) == prim_path:
-            return
+            # Reselecting the same prim in the same stage keeps the existing widget.
+            if self._selection_tracker.update_from_selected_paths(selected_paths):
+                self._on_prim_selection_changed(self._selection_tracker.path)
 
+    def _on_prim_selection_changed(self, prim_path: Sdf.Path | None) -> None:
         if self._widget_container:
             self._widget_container.root.clear()
             self._widget_container = None
+            get_scene_ui_stats().container_removed(PRIM_TRANSFORM_EXAMPLE_NAME)
 
         self._selected_prim = None
 
@@ -225,3 +240,6 @@ class PrimTransformExample:
                 SpatialSource.new_translation_source(Gf.Vec3d(0, top_offset, 0)),
             ],
         )
+        stats = get_scene_ui_stats()
+        stats.container_added(PRIM_TRANSFORM_EXAMPLE_NAME)
+        stats.ui_update()
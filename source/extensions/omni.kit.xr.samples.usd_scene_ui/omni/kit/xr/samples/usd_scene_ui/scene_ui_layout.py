@@ -0,0 +1,224 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+
+__all__ = ["PanelSpec", "SceneUiLayout", "SpaceSpec", "load_layout"]
+
+import hashlib
+import json
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Type
+
+from omni import ui
+from omni.kit.xr.scene_view.utils import UiContainer, WidgetComponent
+from omni.kit.xr.scene_view.utils.spatial_source import SpatialSource
+from pxr import Gf
+
+
+class SpaceSpec(NamedTuple):
+    """
+    One entry of a panel's space stack.
+
+    Supported types are "translation" and "rotation" (a 3 component value), "look_at_camera" (no value) and
+    "prim_path" (a path, which may contain {name} placeholders filled in when the layout is instantiated).
+    """
+
+    type: str
+    value: Any = None
+    # Optional name to look the created SpatialSource up with via SceneUiLayout.sources.
+    name: Optional[str] = None
+
+
+class PanelSpec(NamedTuple):
+    name: str
+    widget: str
+    width: float
+    height: float
+    resolution_scale: float = 1.0
+    widget_args: Tuple[Any, ...] = ()
+    widget_kwargs: Mapping[str, Any] = {}
+    space_stack: Tuple[SpaceSpec, ...] = ()
+
+    @property
+    def uses_prim_path(self) -> bool:
+        """Whether the panel is placed relative to a prim, which has to exist before the panel is added."""
+        return any(space.type == "prim_path" for space in self.space_stack)
+
+
+_SPACE_TYPES = ("translation", "rotation", "look_at_camera", "prim_path")
+
+# Parsed layouts keyed by the hash of the file content, so reloading an unchanged file skips parsing.
+_layout_cache: Dict[str, Tuple[PanelSpec, ...]] = {}
+
+
+def _parse_space(entry: Dict[str, Any]) -> SpaceSpec:
+    space_type = entry.get("type")
+    if space_type not in _SPACE_TYPES:
+        raise ValueError(f"Unknown space type {space_type!r}, expected one of {_SPACE_TYPES}")
+
+    value = entry.get("value")
+    if space_type in ("translation", "rotation"):
+        if not isinstance(value, list) or len(value) != 3:
+            raise ValueError(f"Space type {space_type!r} needs a 3 component value, got {value!r}")
+        value = tuple(float(component) for component in value)
+    elif space_type == "prim_path" and not isinstance(value, str):
+        raise ValueError(f"Space type 'prim_path' needs a path string, got {value!r}")
+
+    return SpaceSpec(space_type, value, entry.get("name"))
+
+
+def _parse_panel(entry: Dict[str, Any]) -> PanelSpec:
+    try:
+        return PanelSpec(
+            name=entry["name"],
+            widget=entry["widget"],
+            width=float(entry["width"]),
+            height=float(entry["height"]),
+            resolution_scale=float(entry.get("resolution_scale", 1.0)),
+            widget_args=tuple(entry.get("widget_args", ())),
+            widget_kwargs=dict(entry.get("widget_kwargs", {})),
+            space_stack=tuple(_parse_space(space) for space in entry.get("space_stack", ())),
+        )
+    except KeyError as e:
+        raise ValueError(f"Layout panel {entry.get('name', entry)!r} is missing {e}") from e
+
+
+def _format_prim_path(panel: PanelSpec, space: SpaceSpec, variables: Mapping[str, str]) -> str:
+    try:
+        return space.value.format(**variables)
+    except KeyError as e:
+        raise ValueError(f"Layout panel {panel.name!r} needs variable {e} for prim path {space.value!r}") from e
+
+
+def load_layout(path: str) -> Tuple[PanelSpec, ...]:
+    """
+    Load the panels of a JSON layout file.
+
+    The file is a JSON object with a "panels" list; see data/layouts/widget_gallery.json for an example.
+    Parsed layouts are cached by the hash of the file content.
+
+    Args:
+        path: Path of the layout file.
+    """
+    with open(path, "rb") as f:
+        content = f.read()
+
+    digest = hashlib.sha1(content).hexdigest()
+    panels = _layout_cache.get(digest)
+    if panels is None:
+        data = json.loads(content)
+        panels = tuple(_parse_panel(entry) for entry in data.get("panels", ()))
+        names = [panel.name for panel in panels]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Layout {path} has duplicate panel names")
+        _layout_cache[digest] = panels
+    return panels
+
+
+class SceneUiLayout:
+    """
+    The widget components and containers of an instantiated layout.
+
+    Panels are created in bulk with `add`, which may be called more than once, for example to add panels that need
+    a prim which does not exist yet later on. Everything that was added is torn down together with `clear`.
+    """
+
+    def __init__(
+        self,
+        widget_types: Mapping[str, Type[ui.Widget]],
+        widget_args: Optional[Mapping[str, List[Any]]] = None,
+    ):
+        """
+        Args:
+            widget_types: The widget classes the layout may use, by the name used in the layout file.
+            widget_args: Positional widget args by panel name, replacing those of the file. Use this for arguments
+                that cannot be written in a file, such as callbacks.
+        """
+        self._widget_types = widget_types
+        self._widget_args = widget_args or {}
+
+        self.components: Dict[str, WidgetComponent] = {}
+        self.sources: Dict[str, SpatialSource] = {}
+        self._containers: List[UiContainer] = []
+
+    def __len__(self) -> int:
+        return len(self._containers)
+
+    def add(self, panels: Iterable[PanelSpec], variables: Optional[Mapping[str, str]] = None) -> int:
+        """
+        Create the containers of `panels`.
+
+        The panels are validated and all their space stacks are built before any container is added to the scene.
+        If creating a container still fails, the containers created by this call are removed before re-raising.
+
+        Args:
+            panels: The panels to create, usually from `load_layout`.
+            variables: Values for the {name} placeholders in "prim_path" spaces.
+
+        Returns:
+            The number of containers created.
+        """
+        panels = tuple(panels)
+        variables = variables or {}
+
+        for panel in panels:
+            if panel.name in self.components:
+                raise ValueError(f"Layout panel {panel.name!r} was already added")
+            if panel.widget not in self._widget_types:
+                raise ValueError(f"Layout panel {panel.name!r} uses unknown widget {panel.widget!r}")
+
+        # Nothing is added to the scene yet, so a missing prim path variable leaves no panel behind.
+        sources: Dict[str, SpatialSource] = {}
+        space_stacks = [
+            [self._create_source(panel, space, variables, sources) for space in panel.space_stack] for panel in panels
+        ]
+
+        components: Dict[str, WidgetComponent] = {}
+        containers: List[UiContainer] = []
+        try:
+            for panel, space_stack in zip(panels, space_stacks):
+                component = WidgetComponent(
+                    self._widget_types[panel.widget],
+                    width=panel.width,
+                    height=panel.height,
+                    resolution_scale=panel.resolution_scale,
+                    widget_args=list(self._widget_args.get(panel.name, panel.widget_args)),
+                    widget_kwargs=dict(panel.widget_kwargs),
+                )
+                containers.append(UiContainer(component, space_stack=space_stack))
+                components[panel.name] = component
+        except Exception:
+            for container in containers:
+                container.root.clear()
+            raise
+
+        self.components.update(components)
+        self.sources.update(sources)
+        self._containers.extend(containers)
+        return len(containers)
+
+    def clear(self) -> None:
+        for container in self._containers:
+            container.root.clear()
+        self._containers.clear()
+        self.components.clear()
+        self.sources.clear()
+
+    def _create_source(
+        self, panel: PanelSpec, space: SpaceSpec, variables: Mapping[str, str], sources: Dict[str, SpatialSource]
+    ) -> SpatialSource:
+        if space.type == "translation":
+            source = SpatialSource.new_translation_source(Gf.Vec3d(*space.value))
+        elif space.type == "rotation":
+            source = SpatialSource.new_rotation_source(Gf.Vec3d(*space.value))
+        elif space.type == "look_at_camera":
+            source = SpatialSource.new_look_at_camera_source()
+        else:
+            source = SpatialSource.new_prim_path_source(_format_prim_path(panel, space, variables))
+
+        if space.name:
+            sources[space.name] = source
+        return source
@@ -0,0 +1,112 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+
+__all__ = ["SceneUiStats", "StatsSampler", "get_scene_ui_stats"]
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+
+class SceneUiStats:
+    """
+    Cheap counters the examples report into, read by the performance HUD.
+
+    Recording is a couple of dict updates, so examples can report unconditionally whether or not the HUD is shown.
+    """
+
+    def __init__(self):
+        self._active_containers: Dict[str, int] = {}
+        self._ui_updates = 0
+        self._rebuilds_avoided = 0
+        self._callback_time: Dict[str, float] = {}
+
+    def container_added(self, example: str, count: int = 1) -> None:
+        self._active_containers[example] = self._active_containers.get(example, 0) + count
+
+    def container_removed(self, example: str, count: int = 1) -> None:
+        self._active_containers[example] = max(0, self._active_containers.get(example, 0) - count)
+
+    @property
+    def active_containers(self) -> int:
+        return sum(self._active_containers.values())
+
+    def ui_update(self, count: int = 1) -> None:
+        """
+        Record that an example rebuilt or updated the content of a scene widget from one of its callbacks.
+
+        This does not include the per-frame redraws of widgets using `scene.Widget.UpdatePolicy.ALWAYS`.
+        """
+        self._ui_updates += count
+
+    @property
+    def ui_updates(self) -> int:
+        return self._ui_updates
+
+    def rebuild_avoided(self, count: int = 1) -> None:
+        """Record that an example kept its existing widgets instead of rebuilding them for an unchanged input."""
+        self._rebuilds_avoided += count
+
+    @property
+    def rebuilds_avoided(self) -> int:
+        return self._rebuilds_avoided
+
+    @contextmanager
+    def timed(self, example: str) -> Iterator[None]:
+        """Add the wall time spent inside the block to the example's callback time."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._callback_time[example] = self._callback_time.get(example, 0.0) + time.perf_counter() - start
+
+    def callback_times(self) -> Dict[str, float]:
+        """Total seconds spent in callbacks, per example, since startup."""
+        return dict(self._callback_time)
+
+
+class StatsSampler:
+    """Turns the running totals of `SceneUiStats` into per-second rates between two `sample` calls."""
+
+    def __init__(self, stats: SceneUiStats):
+        self._stats = stats
+        self._last_time: Optional[float] = None
+        self._last_ui_updates = 0
+        self._last_callback_time: Dict[str, float] = {}
+
+    def sample(self) -> Tuple[float, Dict[str, float]]:
+        """
+        Returns:
+            (UI updates per second, example -> milliseconds of callback time per second) since the last call.
+        """
+        now = time.perf_counter()
+        ui_updates = self._stats.ui_updates
+        callback_time = self._stats.callback_times()
+
+        elapsed = now - self._last_time if self._last_time is not None else 0.0
+        if elapsed > 0.0:
+            ui_update_rate = (ui_updates - self._last_ui_updates) / elapsed
+            callback_rates = {
+                example: (total - self._last_callback_time.get(example, 0.0)) * 1000.0 / elapsed
+                for example, total in callback_time.items()
+            }
+        else:
+            ui_update_rate = 0.0
+            callback_rates = {example: 0.0 for example in callback_time}
+
+        self._last_time = now
+        self._last_ui_updates = ui_updates
+        self._last_callback_time = callback_time
+        return ui_update_rate, callback_rates
+
+
+_scene_ui_stats = SceneUiStats()
+
+
+def get_scene_ui_stats() -> SceneUiStats:
+    return _scene_ui_stats
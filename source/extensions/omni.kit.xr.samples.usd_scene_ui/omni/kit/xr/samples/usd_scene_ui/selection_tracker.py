@@ -0,0 +1,79 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+
+__all__ = ["SelectionTracker"]
+
+from typing import List, Optional
+
+import omni.usd
+from carb.events import IEvent
+from pxr import Sdf
+
+from .scene_ui_stats import get_scene_ui_stats
+from .stage_event_dispatcher import StageEventDispatcher, StageEventRegistration
+
+
+class SelectionTracker:
+    """
+    Remembers the selected `Sdf.Path` and the stage generation it was selected in, so that UI built for a selection
+    is only rebuilt when the selection actually changes.
+
+    The generation is bumped whenever a stage is opened or closed, as the same path in a new stage is a different
+    prim. omni.usd's selection only reports path strings, so an unchanged selection is detected by comparing the
+    reported string with the one the current `Sdf.Path` was built from. That deliberately short-circuits before any
+    `Sdf.Path` is built, and never converts a prim or path back to a string.
+    """
+
+    def __init__(self, stage_event_dispatcher: StageEventDispatcher):
+        self._path: Optional[Sdf.Path] = None
+        # The selected path string _path was built from, None when nothing is selected.
+        self._path_string: Optional[str] = None
+        self._generation = 0
+        # Starts out of date so that the first update always reports a change.
+        self._path_generation = -1
+        self._rebuilds_avoided = 0
+
+        self._registrations: List[StageEventRegistration] = [
+            stage_event_dispatcher.register(omni.usd.StageEventType.OPENED, self._on_stage_changed),
+            stage_event_dispatcher.register(omni.usd.StageEventType.CLOSED, self._on_stage_changed),
+        ]
+
+    def destroy(self) -> None:
+        for registration in self._registrations:
+            registration.unsubscribe()
+        self._registrations.clear()
+
+    @property
+    def path(self) -> Optional[Sdf.Path]:
+        return self._path
+
+    @property
+    def rebuilds_avoided(self) -> int:
+        """How many updates were identical to the tracked selection."""
+        return self._rebuilds_avoided
+
+    def update_from_selected_paths(self, selected_paths: List[str]) -> bool:
+        """
+        Track the first of the selected prim paths, as returned by omni.usd's selection, as the current selection.
+
+        Returns:
+            True if the selection changed and dependent UI has to be rebuilt.
+        """
+        path_string = selected_paths[0] if selected_paths else None
+        if self._path_generation == self._generation and path_string == self._path_string:
+            self._rebuilds_avoided += 1
+            get_scene_ui_stats().rebuild_avoided()
+            return False
+
+        self._path = Sdf.Path(path_string) if path_string else None
+        self._path_string = path_string
+        self._path_generation = self._generation
+        return True
+
+    def _on_stage_changed(self, _event: IEvent) -> None:
+        self._generation += 1
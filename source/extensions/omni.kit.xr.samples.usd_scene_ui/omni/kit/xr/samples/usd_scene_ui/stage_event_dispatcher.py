@@ -0,0 +1,120 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+
+__all__ = ["StageEventDispatcher", "StageEventRegistration"]
+
+import time
+import traceback
+from typing import Callable, Dict, List, Optional, Tuple
+
+import carb
+import omni.usd
+from carb.events import IEvent, ISubscription
+
+StageEventHandler = Callable[[IEvent], None]
+
+
+class StageEventRegistration:
+    """Returned by `StageEventDispatcher.register`. Call `unsubscribe` to stop receiving events."""
+
+    def __init__(self, dispatcher: "StageEventDispatcher", event_type: int, handler: StageEventHandler):
+        self._dispatcher: Optional[StageEventDispatcher] = dispatcher
+        self._event_type = event_type
+        self._handler = handler
+
+    def unsubscribe(self) -> None:
+        if self._dispatcher:
+            self._dispatcher._unregister(self._event_type, self._handler)
+            self._dispatcher = None
+
+
+class StageEventDispatcher:
+    """
+    A single subscription to the USD context's stage event stream, shared by all examples.
+
+    Handlers are registered for one `omni.usd.StageEventType` and looked up by the event type, so events nobody
+    registered for never reach example code. The stream is only subscribed to while at least one handler is
+    registered. The number of events and the time spent in handlers are counted per event type.
+    """
+
+    def __init__(self, usd_context: Optional[omni.usd.UsdContext] = None):
+        self._usd_context = usd_context or omni.usd.get_context()
+        self._stage_event_sub: Optional[ISubscription] = None
+        self._handlers: Dict[int, List[StageEventHandler]] = {}
+        self._event_counts: Dict[int, int] = {}
+        self._handler_time: Dict[int, float] = {}
+
+    def destroy(self) -> None:
+        self._handlers.clear()
+        self._unsubscribe()
+
+    def register(self, event_type: omni.usd.StageEventType, handler: StageEventHandler) -> StageEventRegistration:
+        """
+        Call `handler` for every stage event of `event_type`.
+
+        Args:
+            event_type: The stage event type to receive.
+            handler: Called with the carb event.
+
+        Returns:
+            A registration whose `unsubscribe` removes the handler.
+        """
+        event_type = int(event_type)
+        # Replace rather than mutate the list, it may be being iterated by _on_stage_event.
+        self._handlers[event_type] = [*self._handlers.get(event_type, ()), handler]
+
+        if not self._stage_event_sub:
+            self._stage_event_sub = self._usd_context.get_stage_event_stream().create_subscription_to_pop(
+                self._on_stage_event,
+                name="Stage event dispatcher for XR Scene UI Examples",
+            )
+        return StageEventRegistration(self, event_type, handler)
+
+    def stats(self) -> Dict[int, Tuple[int, float]]:
+        """Event type -> (events received, seconds spent in handlers) since startup."""
+        return {
+            event_type: (count, self._handler_time.get(event_type, 0.0))
+            for event_type, count in self._event_counts.items()
+        }
+
+    def _unregister(self, event_type: int, handler: StageEventHandler) -> None:
+        handlers = self._handlers.get(event_type)
+        if not handlers or handler not in handlers:
+            return
+
+        # Replace rather than mutate the list, it may be being iterated by _on_stage_event.
+        handlers = list(handlers)
+        handlers.remove(handler)
+        if handlers:
+            self._handlers[event_type] = handlers
+        else:
+            del self._handlers[event_type]
+
+        if not self._handlers:
+            self._unsubscribe()
+
+    def _unsubscribe(self) -> None:
+        if self._stage_event_sub:
+            self._stage_event_sub.unsubscribe()
+            self._stage_event_sub = None
+
+    def _on_stage_event(self, event: IEvent) -> None:
+        event_type = event.type
+        self._event_counts[event_type] = self._event_counts.get(event_type, 0) + 1
+
+        handlers = self._handlers.get(event_type)
+        if not handlers:
+            return
+
+        start = time.perf_counter()
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception:
+                carb.log_error(traceback.format_exc())
+        self._handler_time[event_type] = self._handler_time.get(event_type, 0.0) + time.perf_counter() - start
@@ -0,0 +1,4 @@
+from .test_scene_ui_layout import *
+from .test_selection_tracker import *
+from .test_stage_event_dispatcher import *
+from .test_texture_atlas import *
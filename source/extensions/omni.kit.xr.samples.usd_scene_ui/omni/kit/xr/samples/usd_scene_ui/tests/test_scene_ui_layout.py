@@ -0,0 +1,170 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+
+__all__ = ["TestSceneUiLayout"]
+
+import json
+import os
+import tempfile
+from typing import Any, Dict, List
+from unittest import mock
+
+import omni.kit.test
+from omni import ui
+
+from .. import scene_ui_layout
+from ..scene_ui_layout import PanelSpec, SceneUiLayout, SpaceSpec, load_layout
+
+
+class TestSceneUiLayout(omni.kit.test.AsyncTestCase):
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def _write_layout(self, panels: List[Dict[str, Any]], name: str = "layout.json") -> str:
+        path = os.path.join(self._temp_dir.name, name)
+        with open(path, "w") as f:
+            json.dump({"panels": panels}, f)
+        return path
+
+    async def test_load_layout(self):
+        path = self._write_layout(
+            [
+                {
+                    "name": "label",
+                    "widget": "Label",
+                    "width": 400,
+                    "height": 200,
+                    "resolution_scale": 2,
+                    "widget_args": ["Text"],
+                    "space_stack": [
+                        {"type": "translation", "value": [0, 100, 0]},
+                        {"type": "rotation", "value": [0, 45, 0], "name": "rotation"},
+                        {"type": "look_at_camera"},
+                    ],
+                },
+                {
+                    "name": "parented",
+                    "widget": "Label",
+                    "width": 10,
+                    "height": 10,
+                    "space_stack": [
+                        {"type": "prim_path", "value": "{cube}"},
+                    ],
+                },
+            ]
+        )
+
+        label, parented = load_layout(path)
+        self.assertEqual(label.name, "label")
+        self.assertEqual((label.width, label.height, label.resolution_scale), (400.0, 200.0, 2.0))
+        self.assertEqual(label.widget_args, ("Text",))
+        self.assertEqual(
+            label.space_stack,
+            (
+                SpaceSpec("translation", (0.0, 100.0, 0.0)),
+                SpaceSpec("rotation", (0.0, 45.0, 0.0), "rotation"),
+                SpaceSpec("look_at_camera"),
+            ),
+        )
+        self.assertEqual(parented.resolution_scale, 1.0)
+        self.assertFalse(label.uses_prim_path)
+        self.assertTrue(parented.uses_prim_path)
+
+    async def test_load_layout_is_cached_by_content(self):
+        panels = [{"name": "label", "widget": "Label", "width": 1, "height": 1}]
+        first = load_layout(self._write_layout(panels, "first.json"))
+
+        # The same content in another file is served from the cache, changed content is parsed again.
+        self.assertIs(load_layout(self._write_layout(panels, "second.json")), first)
+        panels[0]["width"] = 2
+        changed = load_layout(self._write_layout(panels, "first.json"))
+        self.assertIsNot(changed, first)
+        self.assertEqual(changed[0].width, 2.0)
+
+    async def test_load_layout_errors(self):
+        invalid_layouts = {
+            "unknown space type": [
+                {"name": "a", "widget": "W", "width": 1, "height": 1, "space_stack": [{"type": "x"}]}
+            ],
+            "short translation": [
+                {
+                    "name": "a",
+                    "widget": "W",
+                    "width": 1,
+                    "height": 1,
+                    "space_stack": [
+                        {"type": "translation", "value": [0, 1]},
+                    ],
+                },
+            ],
+            "prim path not a string": [
+                {
+                    "name": "a",
+                    "widget": "W",
+                    "width": 1,
+                    "height": 1,
+                    "space_stack": [
+                        {"type": "prim_path", "value": 3},
+                    ],
+                },
+            ],
+            "missing width": [{"name": "a", "widget": "W", "height": 1}],
+            "missing widget": [{"name": "a", "width": 1, "height": 1}],
+            "duplicate names": [
+                {"name": "a", "widget": "W", "width": 1, "height": 1},
+                {"name": "a", "widget": "W", "width": 2, "height": 2},
+            ],
+        }
+        for description, panels in invalid_layouts.items():
+            with self.subTest(description):
+                with self.assertRaises(ValueError):
+                    load_layout(self._write_layout(panels))
+
+    async def test_add_missing_variable_creates_nothing(self):
+        layout = SceneUiLayout({"Label": ui.Widget})
+        panels = [
+            PanelSpec("static", "Label", 10, 10),
+            PanelSpec("parented", "Label", 10, 10, space_stack=(SpaceSpec("prim_path", "{cube}"),)),
+        ]
+
+        with self.assertRaises(ValueError):
+            layout.add(panels)
+        self.assertEqual(len(layout), 0)
+        self.assertEqual(layout.components, {})
+
+    async def test_add_unknown_widget_creates_nothing(self):
+        layout = SceneUiLayout({"Label": ui.Widget})
+
+        with self.assertRaises(ValueError):
+            layout.add([PanelSpec("static", "Label", 10, 10), PanelSpec("other", "Unknown", 10, 10)])
+        self.assertEqual(len(layout), 0)
+
+    async def test_add_failure_clears_created_containers(self):
+        created = []
+
+        def __create_container(component, space_stack):
+            if created:
+                raise RuntimeError("container failed")
+            container = mock.MagicMock()
+            created.append(container)
+            return container
+
+        layout = SceneUiLayout({"Label": ui.Widget})
+        with mock.patch.object(scene_ui_layout, "WidgetComponent"), mock.patch.object(
+            scene_ui_layout, "UiContainer", side_effect=__create_container
+        ):
+            with self.assertRaises(RuntimeError):
+                layout.add([PanelSpec("first", "Label", 10, 10), PanelSpec("second", "Label", 10, 10)])
+
+        self.assertEqual(len(created), 1)
+        created[0].root.clear.assert_called_once()
+        self.assertEqual(len(layout), 0)
+        self.assertEqual(layout.components, {})
@@ -0,0 +1,70 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+
+__all__ = ["TestSelectionTracker"]
+
+import omni.kit.test
+import omni.usd
+from pxr import Sdf
+
+from ..selection_tracker import SelectionTracker
+from ..stage_event_dispatcher import StageEventDispatcher
+from .test_stage_event_dispatcher import FakeUsdContext
+
+
+class TestSelectionTracker(omni.kit.test.AsyncTestCase):
+    def setUp(self):
+        self._usd_context = FakeUsdContext()
+        self._dispatcher = StageEventDispatcher(self._usd_context)
+        self._tracker = SelectionTracker(self._dispatcher)
+
+    def tearDown(self):
+        self._tracker.destroy()
+        self._dispatcher.destroy()
+
+    async def test_same_selection_is_skipped(self):
+        self.assertTrue(self._tracker.update_from_selected_paths(["/World/Cube"]))
+        self.assertEqual(self._tracker.rebuilds_avoided, 0)
+
+        self.assertFalse(self._tracker.update_from_selected_paths(["/World/Cube"]))
+        self.assertFalse(self._tracker.update_from_selected_paths(["/World/Cube", "/World/Other"]))
+        self.assertEqual(self._tracker.rebuilds_avoided, 2)
+        self.assertEqual(self._tracker.path, Sdf.Path("/World/Cube"))
+
+    async def test_different_selection_rebuilds(self):
+        self._tracker.update_from_selected_paths(["/World/Cube"])
+
+        self.assertTrue(self._tracker.update_from_selected_paths(["/World/Sphere"]))
+        self.assertEqual(self._tracker.path, Sdf.Path("/World/Sphere"))
+        self.assertEqual(self._tracker.rebuilds_avoided, 0)
+
+    async def test_empty_selection(self):
+        self._tracker.update_from_selected_paths(["/World/Cube"])
+
+        self.assertTrue(self._tracker.update_from_selected_paths([]))
+        self.assertIsNone(self._tracker.path)
+        self.assertFalse(self._tracker.update_from_selected_paths([]))
+        self.assertEqual(self._tracker.rebuilds_avoided, 1)
+
+    async def test_first_empty_selection_rebuilds(self):
+        self.assertTrue(self._tracker.update_from_selected_paths([]))
+        self.assertFalse(self._tracker.update_from_selected_paths([]))
+
+    async def test_stage_change_forces_rebuild(self):
+        for event_type in (omni.usd.StageEventType.OPENED, omni.usd.StageEventType.CLOSED):
+            with self.subTest(event_type=event_type):
+                self._tracker.update_from_selected_paths(["/World/Cube"])
+                self.assertFalse(self._tracker.update_from_selected_paths(["/World/Cube"]))
+
+                self._usd_context.push(event_type)
+                self.assertTrue(self._tracker.update_from_selected_paths(["/World/Cube"]))
+                self.assertEqual(self._tracker.path, Sdf.Path("/World/Cube"))
+
+    async def test_destroy_stops_listening(self):
+        self._tracker.destroy()
+        self.assertIsNone(self._usd_context.stream.callback)
@@ -0,0 +1,131 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+
+__all__ = ["TestStageEventDispatcher"]
+
+from types import SimpleNamespace
+from typing import Callable, List, Optional
+
+import omni.kit.test
+
+from ..stage_event_dispatcher import StageEventDispatcher
+
+
+class _FakeSubscription:
+    def __init__(self, stream: "_FakeEventStream"):
+        self._stream = stream
+
+    def unsubscribe(self):
+        self._stream.callback = None
+
+
+class _FakeEventStream:
+    def __init__(self):
+        self.callback: Optional[Callable] = None
+        self.subscription_count = 0
+
+    def create_subscription_to_pop(self, callback: Callable, name: str = ""):
+        self.callback = callback
+        self.subscription_count += 1
+        return _FakeSubscription(self)
+
+
+class FakeUsdContext:
+    """Stands in for omni.usd.UsdContext; `push` delivers a stage event of the given type to the subscriber."""
+
+    def __init__(self):
+        self.stream = _FakeEventStream()
+
+    def get_stage_event_stream(self) -> _FakeEventStream:
+        return self.stream
+
+    def push(self, event_type: int) -> None:
+        if self.stream.callback:
+            self.stream.callback(SimpleNamespace(type=int(event_type), payload={}))
+
+
+class TestStageEventDispatcher(omni.kit.test.AsyncTestCase):
+    def setUp(self):
+        self._usd_context = FakeUsdContext()
+        self._dispatcher = StageEventDispatcher(self._usd_context)
+
+    def tearDown(self):
+        self._dispatcher.destroy()
+
+    async def test_routes_by_type(self):
+        received: List[str] = []
+        self._dispatcher.register(1, lambda event: received.append(f"a{event.type}"))
+        self._dispatcher.register(2, lambda event: received.append(f"b{event.type}"))
+
+        self._usd_context.push(1)
+        self._usd_context.push(2)
+        self._usd_context.push(3)
+
+        self.assertEqual(received, ["a1", "b2"])
+        self.assertEqual(self._usd_context.stream.subscription_count, 1)
+
+    async def test_subscribes_only_while_handlers_are_registered(self):
+        self.assertIsNone(self._usd_context.stream.callback)
+
+        first = self._dispatcher.register(1, lambda _: None)
+        second = self._dispatcher.register(2, lambda _: None)
+        self.assertIsNotNone(self._usd_context.stream.callback)
+
+        first.unsubscribe()
+        self.assertIsNotNone(self._usd_context.stream.callback)
+        second.unsubscribe()
+        self.assertIsNone(self._usd_context.stream.callback)
+
+        # Unsubscribing twice is harmless.
+        second.unsubscribe()
+
+    async def test_register_inside_handler(self):
+        received: List[str] = []
+
+        def __register_another(_event):
+            received.append("outer")
+            self._dispatcher.register(1, lambda _: received.append("inner"))
+
+        self._dispatcher.register(1, __register_another)
+
+        # The handler registered during dispatch only sees the next event.
+        self._usd_context.push(1)
+        self.assertEqual(received, ["outer"])
+        self._usd_context.push(1)
+        self.assertEqual(received, ["outer", "outer", "inner"])
+
+    async def test_unsubscribe_inside_handler(self):
+        received: List[str] = []
+        registrations = []
+
+        def __unsubscribe_all(_event):
+            received.append("first")
+            for registration in registrations:
+                registration.unsubscribe()
+
+        registrations.append(self._dispatcher.register(1, __unsubscribe_all))
+        registrations.append(self._dispatcher.register(1, lambda _: received.append("second")))
+
+        # The current dispatch still reaches every handler registered when it started.
+        self._usd_context.push(1)
+        self.assertEqual(received, ["first", "second"])
+        self.assertIsNone(self._usd_context.stream.callback)
+
+    async def test_stats(self):
+        self._dispatcher.register(1, lambda _: None)
+
+        self._usd_context.push(1)
+        self._usd_context.push(1)
+        self._usd_context.push(2)
+
+        stats = self._dispatcher.stats()
+        self.assertEqual(set(stats), {1, 2})
+        self.assertEqual(stats[1][0], 2)
+        self.assertGreaterEqual(stats[1][1], 0.0)
+        # Events nobody handles are counted but take no handler time.
+        self.assertEqual(stats[2], (1, 0.0))
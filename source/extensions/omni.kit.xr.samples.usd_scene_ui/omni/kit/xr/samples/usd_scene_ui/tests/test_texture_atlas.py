@@ -0,0 +1,118 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+
+__all__ = ["TestTextureAtlas"]
+
+import random
+from typing import Dict, Tuple
+
+import omni.kit.test
+
+from ..texture_atlas import AtlasStats, ShelfPacker, TextureAtlas
+
+
+class TestTextureAtlas(omni.kit.test.AsyncTestCase):
+    def _assert_valid_layout(self, regions: Dict[int, Tuple[int, int, int, int]], width: int, height: int):
+        rects = list(regions.values())
+        for x, y, rect_width, rect_height in rects:
+            self.assertGreaterEqual(x, 0)
+            self.assertGreaterEqual(y, 0)
+            self.assertLessEqual(x + rect_width, width)
+            self.assertLessEqual(y + rect_height, height)
+
+        for index, (x1, y1, w1, h1) in enumerate(rects):
+            for x2, y2, w2, h2 in rects[index + 1 :]:
+                overlaps = x1 < x2 + w2 and x2 < x1 + w1 and y1 < y2 + h2 and y2 < y1 + h1
+                self.assertFalse(overlaps, f"{(x1, y1, w1, h1)} overlaps {(x2, y2, w2, h2)}")
+
+    def _assert_valid_stats(self, stats: AtlasStats):
+        self.assertGreaterEqual(stats.occupancy, 0.0)
+        self.assertLessEqual(stats.occupancy, 1.0)
+        self.assertGreaterEqual(stats.fragmentation, 0.0)
+        self.assertLessEqual(stats.fragmentation, 1.0)
+
+    async def test_packer_alloc_free_defragment(self):
+        for seed in range(200):
+            rng = random.Random(seed)
+            packer = ShelfPacker(128, 128, padding=rng.choice((0, 1)))
+            live = {}
+            for _ in range(60):
+                if live and rng.random() < 0.4:
+                    region_id = rng.choice(list(live))
+                    packer.free(region_id)
+                    del live[region_id]
+                else:
+                    result = packer.allocate(rng.randint(1, 48), rng.randint(1, 48))
+                    if result is not None:
+                        live[result[0]] = result
+
+                self._assert_valid_layout(packer.regions(), packer.width, packer.height)
+                self._assert_valid_stats(packer.stats)
+
+            before = packer.regions()
+            moved = packer.defragment()
+            after = packer.regions()
+
+            self.assertEqual(set(before), set(after))
+            for region_id, (x, y, width, height) in after.items():
+                self.assertEqual((width, height), before[region_id][2:])
+                if region_id not in moved:
+                    self.assertEqual((x, y), before[region_id][:2])
+            self._assert_valid_layout(after, packer.width, packer.height)
+            self._assert_valid_stats(packer.stats)
+
+    async def test_packer_defragment_keeps_layout_when_repack_fails(self):
+        packer = ShelfPacker(32, 32, padding=0)
+        self.assertIsNotNone(packer.allocate(2, 21))
+        self.assertIsNotNone(packer.allocate(31, 5))
+        self.assertIsNotNone(packer.allocate(28, 11))
+        before = packer.regions()
+
+        self.assertEqual(packer.defragment(), {})
+        self.assertEqual(packer.regions(), before)
+
+    async def test_atlas_alloc_free_defragment(self):
+        for seed in range(50):
+            rng = random.Random(seed)
+            atlas = TextureAtlas(page_size=256, max_pages=3, max_region_size=128)
+            live = []
+            for _ in range(120):
+                if live and rng.random() < 0.4:
+                    atlas.free(live.pop(rng.randrange(len(live))))
+                else:
+                    region = atlas.allocate(rng.randint(1, 128), rng.randint(1, 128))
+                    if region is not None:
+                        live.append(region)
+
+                self.assertLessEqual(atlas.page_count, 3)
+                self._assert_valid_stats(atlas.stats)
+
+            page_count = atlas.page_count
+            moved = atlas.defragment()
+            current = {region.region_id: moved.get(region.region_id, region) for region in live}
+
+            self.assertLessEqual(atlas.page_count, page_count)
+            self.assertEqual(atlas.stats.regions, len(live))
+            self._assert_valid_stats(atlas.stats)
+            for page in range(atlas.page_count):
+                regions = {region_id: region.pixel_rect for region_id, region in current.items() if region.page == page}
+                self._assert_valid_layout(regions, 256, 256)
+
+    async def test_atlas_defragment_respects_max_pages(self):
+        atlas = TextureAtlas(page_size=32, max_pages=1, max_region_size=32, padding=0)
+        regions = [atlas.allocate(2, 21), atlas.allocate(31, 5), atlas.allocate(28, 11)]
+        self.assertNotIn(None, regions)
+
+        self.assertEqual(atlas.defragment(), {})
+        self.assertEqual(atlas.page_count, 1)
+        self.assertEqual(atlas.stats.regions, 3)
+
+    async def test_atlas_does_not_keep_page_for_failed_allocation(self):
+        atlas = TextureAtlas(page_size=32, max_pages=2, max_region_size=64)
+        self.assertIsNone(atlas.allocate(40, 40))
+        self.assertEqual(atlas.page_count, 0)
@@ -0,0 +1,398 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# NVIDIA CORPORATION and its licensors retain all intellectual property
+# and proprietary rights in and to this software, related documentation
+# and any modifications thereto.  Any use, reproduction, disclosure or
+# distribution of this software and related documentation without an express
+# license agreement from NVIDIA CORPORATION is strictly prohibited.
+
+__all__ = ["AtlasRegion", "AtlasStats", "ShelfPacker", "TextureAtlas"]
+
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+DEFAULT_PAGE_SIZE: int = 2048
+# Widgets with either side larger than this, in pixels, keep their own render target. A 400x200 label at
+# resolution_scale 2 is 800x400 pixels, so ten of them share one 2048x2048 page.
+DEFAULT_MAX_REGION_SIZE: int = 1024
+# A shelf is reused for a rect up to this factor shorter than the shelf, otherwise a new shelf is opened.
+SHELF_HEIGHT_TOLERANCE: float = 1.5
+
+
+class AtlasRegion(NamedTuple):
+    """A rectangle allocated in one page of a texture atlas, in pixels."""
+
+    region_id: int
+    page: int
+    x: int
+    y: int
+    width: int
+    height: int
+
+    @property
+    def pixel_rect(self) -> Tuple[int, int, int, int]:
+        """The (x, y, width, height) of the region, in pixels, inside its page."""
+        return (self.x, self.y, self.width, self.height)
+
+
+class AtlasStats(NamedTuple):
+    """Occupancy and fragmentation of a packer or of a whole atlas."""
+
+    pages: int
+    regions: int
+    used_area: int
+    total_area: int
+    occupancy: float
+    fragmentation: float
+
+
+class _Shelf:
+    """A horizontal strip of a page. Free space inside the strip is kept as sorted, merged (x, width) spans."""
+
+    def __init__(self, y: int, height: int, width: int):
+        self.y = y
+        self.height = height
+        self.free_spans: List[Tuple[int, int]] = [(0, width)]
+        self.used = 0
+
+    def allocate(self, width: int) -> Optional[int]:
+        # Best fit: the narrowest span the rect fits in.
+        best_index = -1
+        for index, (_, span_width) in enumerate(self.free_spans):
+            if span_width >= width and (best_index < 0 or span_width < self.free_spans[best_index][1]):
+                best_index = index
+        if best_index < 0:
+            return None
+
+        x, span_width = self.free_spans[best_index]
+        if span_width == width:
+            del self.free_spans[best_index]
+        else:
+            self.free_spans[best_index] = (x + width, span_width - width)
+        self.used += 1
+        return x
+
+    def release(self, x: int, width: int) -> None:
+        spans = self.free_spans
+        index = 0
+        while index < len(spans) and spans[index][0] < x:
+            index += 1
+        spans.insert(index, (x, width))
+
+        # Merge with the following span, then with the preceding one.
+        if index + 1 < len(spans) and x + width == spans[index + 1][0]:
+            spans[index] = (x, width + spans[index + 1][1])
+            del spans[index + 1]
+        if index > 0 and spans[index - 1][0] + spans[index - 1][1] == x:
+            spans[index - 1] = (spans[index - 1][0], spans[index - 1][1] + spans[index][1])
+            del spans[index]
+        self.used -= 1
+
+    def largest_free_span(self) -> int:
+        return max((span_width for _, span_width in self.free_spans), default=0)
+
+
+class ShelfPacker:
+    """
+    A shelf rectangle packer for a single atlas page.
+
+    Rects are placed left to right on horizontal shelves. Freed rects return their span to the shelf so it can be
+    reused, and a trailing empty shelf is dropped so its height is available again. Because freed space on a shelf
+    can only be reused by rects no taller than that shelf, call `defragment` to repack the page after heavy churn.
+
+    The packer only does bookkeeping, it never touches a texture, so it can be used and tested without a GPU.
+    """
+
+    def __init__(self, width: int = DEFAULT_PAGE_SIZE, height: int = DEFAULT_PAGE_SIZE, padding: int = 1):
+        if width <= 0 or height <= 0:
+            raise ValueError(f"Atlas page size must be positive, got {width}x{height}")
+
+        self._width = width
+        self._height = height
+        self._padding = padding
+        self._shelves: List[_Shelf] = []
+        # region_id -> (shelf, x, padded width, width, height)
+        self._regions: Dict[int, Tuple[_Shelf, int, int, int, int]] = {}
+        self._next_id = 0
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    def __contains__(self, region_id: int) -> bool:
+        return region_id in self._regions
+
+    def allocate(self, width: int, height: int, region_id: Optional[int] = None) -> Optional[Tuple[int, int, int]]:
+        """
+        Reserve a width x height rect.
+
+        Args:
+            width: Width of the rect in pixels.
+            height: Height of the rect in pixels.
+            region_id: Id to store the rect under. A new id is generated if not given.
+
+        Returns:
+            (region_id, x, y) of the reserved rect, or None if the page has no room for it.
+        """
+        if width <= 0 or height <= 0:
+            raise ValueError(f"Atlas regions must have a positive size, got {width}x{height}")
+
+        padded_width = width + self._padding
+        padded_height = height + self._padding
+        if padded_width > self._width + self._padding or padded_height > self._height + self._padding:
+            return None
+
+        placement = self._place(padded_width, padded_height)
+        if placement is None:
+            return None
+
+        shelf, x = placement
+        if region_id is None:
+            region_id = self._next_id
+        self._next_id = max(self._next_id, region_id + 1)
+        self._regions[region_id] = (shelf, x, padded_width, width, height)
+        return region_id, x, shelf.y
+
+    def free(self, region_id: int) -> None:
+        """Release a previously allocated rect. Unknown ids raise a KeyError."""
+        shelf, x, padded_width, _, _ = self._regions.pop(region_id)
+        shelf.release(x, padded_width)
+
+        # Pop empty shelves off the end of the page so that their height can be reused by any rect.
+        while self._shelves and self._shelves[-1].used == 0:
+            self._shelves.pop()
+
+    def clear(self) -> None:
+        self._shelves.clear()
+        self._regions.clear()
+
+    def regions(self) -> Dict[int, Tuple[int, int, int, int]]:
+        """All live rects as region_id -> (x, y, width, height)."""
+        return {
+            region_id: (x, shelf.y, width, height) for region_id, (shelf, x, _, width, height) in self._regions.items()
+        }
+
+    def defragment(self) -> Dict[int, Tuple[int, int]]:
+        """
+        Repack every live rect, tallest first, into fresh shelves.
+
+        Returns:
+            region_id -> new (x, y) for every rect that moved. Callers must re-render the content of moved rects.
+            If the rects do not all fit when repacked, the current layout is kept and nothing is returned.
+        """
+        old = self.regions()
+        old_shelves, old_regions = self._shelves, self._regions
+        self._shelves, self._regions = [], {}
+
+        moved: Dict[int, Tuple[int, int]] = {}
+        for region_id, (x, y, width, height) in sorted(old.items(), key=lambda item: (-item[1][3], -item[1][2])):
+            result = self.allocate(width, height, region_id)
+            if result is None:
+                # Sorting by height does not guarantee a fit, so fall back to the layout that is known to work.
+                self._shelves, self._regions = old_shelves, old_regions
+                return {}
+            _, new_x, new_y = result
+            if (new_x, new_y) != (x, y):
+                moved[region_id] = (new_x, new_y)
+        return moved
+
+    @property
+    def used_area(self) -> int:
+        return sum(width * height for _, _, _, width, height in self._regions.values())
+
+    @property
+    def largest_free_area(self) -> int:
+        """The largest single free rect, either on an existing shelf or in the unused space below the last shelf."""
+        largest = self._width * self._remaining_height()
+        for shelf in self._shelves:
+            largest = max(largest, shelf.largest_free_span() * shelf.height)
+        return largest
+
+    @property
+    def stats(self) -> AtlasStats:
+        """
+        Occupancy is used area over page area. Fragmentation is the share of free area that is not part of the
+        largest free rect: 0.0 means all free space is in one piece, values near 1.0 mean it is scattered.
+        """
+        total_area = self._width * self._height
+        used_area = self.used_area
+        free_area = total_area - used_area
+        fragmentation = 1.0 - min(1.0, self.largest_free_area / free_area) if free_area > 0 else 0.0
+        return AtlasStats(1, len(self._regions), used_area, total_area, used_area / total_area, fragmentation)
+
+    def _remaining_height(self) -> int:
+        top = self._shelves[-1].y + self._shelves[-1].height if self._shelves else 0
+        return max(0, self._height + self._padding - top)
+
+    def _place(self, width: int, height: int) -> Optional[Tuple[_Shelf, int]]:
+        # Reuse the shortest existing shelf the rect fits on without wasting too much height.
+        candidates = [shelf for shelf in self._shelves if height <= shelf.height <= height * SHELF_HEIGHT_TOLERANCE]
+        for shelf in sorted(candidates, key=lambda shelf: shelf.height):
+            x = shelf.allocate(width)
+            if x is not None:
+                return shelf, x
+
+        if height <= self._remaining_height():
+            y = self._shelves[-1].y + self._shelves[-1].height if self._shelves else 0
+            shelf = _Shelf(y, height, self._width + self._padding)
+            self._shelves.append(shelf)
+            x = shelf.allocate(width)
+            if x is not None:
+                return shelf, x
+            self._shelves.pop()
+
+        # Last resort: any taller shelf with room, regardless of wasted height.
+        for shelf in sorted(self._shelves, key=lambda shelf: shelf.height):
+            if shelf.height > height * SHELF_HEIGHT_TOLERANCE:
+                x = shelf.allocate(width)
+                if x is not None:
+                    return shelf, x
+        return None
+
+
+class TextureAtlas:
+    """
+    Shares pages of one large texture between many small scene widgets.
+
+    Each page is a `ShelfPacker`. Pages are added on demand up to `max_pages`, and widgets larger than
+    `max_region_size` are refused so they keep a render target of their own. Rendering a widget into its region is
+    left to the caller; the atlas only hands out and tracks `AtlasRegion`s.
+
+    Freeing the last region of a page only releases the page if it is the last one, so that the page index of
+    every other region stays valid. Empty pages in the middle are reused by later allocations and are released by
+    `defragment`.
+    """
+
+    def __init__(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_pages: int = 4,
+        max_region_size: int = DEFAULT_MAX_REGION_SIZE,
+        padding: int = 1,
+    ):
+        self._page_size = page_size
+        self._max_pages = max_pages
+        self._max_region_size = max_region_size
+        self._padding = padding
+        self._pages: List[ShelfPacker] = []
+        self._region_pages: Dict[int, int] = {}
+        self._next_id = 0
+
+    @property
+    def page_count(self) -> int:
+        return len(self._pages)
+
+    def fits(self, width: int, height: int) -> bool:
+        """Whether a widget of this pixel size is small enough to be packed."""
+        return 0 < width <= self._max_region_size and 0 < height <= self._max_region_size
+
+    def allocate(self, width: int, height: int) -> Optional[AtlasRegion]:
+        """
+        Reserve a region for a width x height widget.
+
+        Returns:
+            The reserved region, or None if the widget is too large or all pages are full.
+        """
+        if not self.fits(width, height):
+            return None
+
+        region_id = self._next_id
+        for page_index, page in enumerate(self._pages):
+            result = page.allocate(width, height, region_id)
+            if result is not None:
+                return self._add_region(page_index, result, width, height)
+
+        if len(self._pages) >= self._max_pages:
+            return None
+
+        page = ShelfPacker(self._page_size, self._page_size, self._padding)
+        result = page.allocate(width, height, region_id)
+        if result is None:
+            return None
+        self._pages.append(page)
+        return self._add_region(len(self._pages) - 1, result, width, height)
+
+    def free(self, region: AtlasRegion) -> None:
+        page_index = self._region_pages.pop(region.region_id)
+        self._pages[page_index].free(region.region_id)
+
+        # Drop empty pages at the end so their texture memory can be released.
+        while self._pages and len(self._pages[-1]) == 0:
+            self._pages.pop()
+
+    def defragment(self) -> Dict[int, AtlasRegion]:
+        """
+        Repack all regions, tallest first, into as few pages as possible.
+
+        Returns:
+            region_id -> new AtlasRegion for every region that moved. If the repacked regions would need more pages
+            than the current layout or than `max_pages`, the current layout is kept and nothing is returned.
+        """
+        live: List[Tuple[int, int, int, int, int, int]] = []
+        for page_index, page in enumerate(self._pages):
+            for region_id, (x, y, width, height) in page.regions().items():
+                live.append((region_id, page_index, x, y, width, height))
+        live.sort(key=lambda entry: (-entry[5], -entry[4]))
+
+        # Defragmenting must never allocate more textures than the current layout uses.
+        max_pages = min(self._max_pages, len(self._pages))
+
+        pages: List[ShelfPacker] = []
+        region_pages: Dict[int, int] = {}
+        moved: Dict[int, AtlasRegion] = {}
+        for region_id, old_page, old_x, old_y, width, height in live:
+            result = None
+            for page_index, page in enumerate(pages):
+                result = page.allocate(width, height, region_id)
+                if result is not None:
+                    break
+            else:
+                if len(pages) >= max_pages:
+                    return {}
+                page_index = len(pages)
+                pages.append(ShelfPacker(self._page_size, self._page_size, self._padding))
+                result = pages[page_index].allocate(width, height, region_id)
+                if result is None:
+                    return {}
+
+            region_pages[region_id] = page_index
+            _, x, y = result
+            if (page_index, x, y) != (old_page, old_x, old_y):
+                moved[region_id] = AtlasRegion(region_id, page_index, x, y, width, height)
+
+        self._pages = pages
+        self._region_pages = region_pages
+        return moved
+
+    @property
+    def stats(self) -> AtlasStats:
+        page_stats = [page.stats for page in self._pages]
+        used_area = sum(stats.used_area for stats in page_stats)
+        total_area = sum(stats.total_area for stats in page_stats)
+        free_area = total_area - used_area
+        # Weight each page's fragmentation by its share of the free area.
+        fragmentation = (
+            sum(stats.fragmentation * (stats.total_area - stats.used_area) for stats in page_stats) / free_area
+            if free_area > 0
+            else 0.0
+        )
+        return AtlasStats(
+            len(self._pages),
+            len(self._region_pages),
+            used_area,
+            total_area,
+            used_area / total_area if total_area else 0.0,
+            fragmentation,
+        )
+
+    def _add_region(self, page_index: int, result: Tuple[int, int, int], width: int, height: int) -> AtlasRegion:
+        region_id, x, y = result
+        self._next_id = region_id + 1
+        self._region_pages[region_id] = page_index
+        return AtlasRegion(region_id, page_index, x, y, width, height)
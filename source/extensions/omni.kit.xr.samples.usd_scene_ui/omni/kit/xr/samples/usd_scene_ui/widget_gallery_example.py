@@ -8,17 +8,23 @@
 
 import asyncio
 import math
-from typing import Any, Callable, Dict, Optional
+import traceback
+from typing import Any, Callable, Dict, Optional, Tuple
 
+import carb
 import omni.kit.commands
 from omni import ui
 from omni.kit.xr.core import XREditorMenuToggleItem
-from omni.kit.xr.scene_view.utils import UiContainer, WidgetComponent
-from omni.kit.xr.scene_view.utils.spatial_source import RotationSpace, SpatialSource
+from omni.kit.xr.scene_view.utils.spatial_source import RotationSpace
 from omni.ui import scene
 from pxr import Gf
 
+from .scene_ui_layout import PanelSpec, SceneUiLayout, load_layout
+from .scene_ui_stats import get_scene_ui_stats
+from .texture_atlas import TextureAtlas
+
 WIDGET_GALLERY_EXAMPLE_MENU_PATH: str = "Examples/(XR UI) Basic Widget Gallery"
+WIDGET_GALLERY_EXAMPLE_NAME: str = "Widget Gallery"
 
 
 class SimpleTextWidget(ui.Widget):
@@ -73,8 +79,11 @@ class CountingWidget(ui.Widget):
             self._ui_label.text = self._text
 
     def _on_button_clicked(self):
-        self._count = self._count + 1
-        self._ui_label.text = str(self._count)
+        stats = get_scene_ui_stats()
+        with stats.timed(WIDGET_GALLERY_EXAMPLE_NAME):
+            self._count = self._count + 1
+            self._ui_label.text = str(self._count)
+            stats.ui_update()
 
     def _build_ui(self):
         with ui.VStack():
@@ -92,15 +101,16 @@ class WidgetGalleryExample:
     3. A counter widget where clicking on the button increases the count.
     4. A text widget parented to a cube. Moving the cube moves the text.
     5. A slider widget that rotates the text above, displaying the yaw degrees.
+
+    The size, resolution and placement of every panel comes from data/layouts/widget_gallery.json, so panels can be
+    added or moved without changing this code. Panels placed relative to a prim are added one frame later, once the
+    prim is ready.
     """
 
     def __init__(self, ext_id: str):
-        self._static_text_widget_container: Optional[UiContainer] = None
-        self._camera_facing_widget_container: Optional[UiContainer] = None
-        self._counting_widget_container: Optional[UiContainer] = None
-        self._parented_widget_container: Optional[UiContainer] = None
-        self._rotatable_text_widget_container: Optional[UiContainer] = None
-        self._rotatable_slider_widget_container: Optional[UiContainer] = None
+        self._ext_id = ext_id
+        self._layout: Optional[SceneUiLayout] = None
+        self._show_task: Optional[asyncio.Future] = None
 
         self._example_menu_item = XREditorMenuToggleItem(
             ext_id, WIDGET_GALLERY_EXAMPLE_MENU_PATH, self._toggle_example, value=False
@@ -123,116 +133,78 @@ class WidgetGalleryExample:
             self._hide()
 
     def _hide(self):
-        if self._static_text_widget_container:
-            self._static_text_widget_container.root.clear()
-            self._static_text_widget_container = None
-
-        if self._camera_facing_widget_container:
-            self._camera_facing_widget_container.root.clear()
-            self._camera_facing_widget_container = None
-
-        if self._counting_widget_container:
-            self._counting_widget_container.root.clear()
-            self._counting_widget_container = None
-
-        if self._parented_widget_container:
-            self._parented_widget_container.root.clear()
-            self._parented_widget_container = None
-
-        if self._rotatable_text_widget_container:
-            self._rotatable_text_widget_container.root.clear()
-            self._rotatable_text_widget_container = None
+        if self._show_task and not self._show_task.done():
+            self._show_task.cancel()
+        self._show_task = None
 
-        if self._rotatable_slider_widget_container:
-            self._rotatable_slider_widget_container.root.clear()
-            self._rotatable_slider_widget_container = None
+        if self._layout is not None:
+            get_scene_ui_stats().container_removed(WIDGET_GALLERY_EXAMPLE_NAME, len(self._layout))
+            self._layout.clear()
+            self._layout = None
 
     def _show(self):
-        # 1. Place static "Simple Text" at the origin.
-        static_text_widget_component = WidgetComponent(SimpleTextWidget, width=400, height=200)
-
-        self._static_text_widget_container = UiContainer(static_text_widget_component)
-
-        # 2. Camera facing widget 200 units above the Static Label.
-        # Increase the resolution_scale. Notice that the text appears sharper.
-        camera_facing_widget_component = WidgetComponent(
-            SimpleTextWidget,
-            width=400,
-            height=200,
-            resolution_scale=2,
-            widget_args=["Camera Facing", {"font_size": 50, "color": omni.ui.color.green}],
-        )
-
-        self._camera_facing_widget_container = UiContainer(
-            camera_facing_widget_component,
-            space_stack=[
-                SpatialSource.new_translation_source(Gf.Vec3d(0, 200, 0)),
-                SpatialSource.new_look_at_camera_source(),
-            ],
-        )
-
-        # 3. A counting widget to the left of the static widget and rotated 45 degrees in yaw to face the user.
-        counting_widget_component = WidgetComponent(CountingWidget, width=200, height=200, resolution_scale=2)
-
-        self._counting_widget_container = UiContainer(
-            counting_widget_component,
-            space_stack=[
-                SpatialSource.new_translation_source(Gf.Vec3d(-600, 100, 0)),
-                SpatialSource.new_rotation_source(Gf.Vec3d(0, 45, 0)),
-            ],
-        )
+        extension_path = omni.kit.app.get_app().get_extension_manager().get_extension_path(self._ext_id)
+        panels = load_layout(extension_path + "/data/layouts/widget_gallery.json")
+        self._log_atlas_usage(panels)
 
-        # 4. Create a Cube and place a text widget parented above it.
+        # 4. Create a Cube for the text widget parented above it.
         _, cube_prim_path = omni.kit.commands.execute(
             "CreateMeshPrimWithDefaultXform", prim_type="Cube", object_origin=[400, 0, 0], select_new_prim=False
         )
 
+        # The slider causes the text above it to rotate. They are separate panels because we don't want to rotate
+        # the slider.
+        def __on_rotate(value: ui.AbstractValueModel):
+            stats = get_scene_ui_stats()
+            with stats.timed(WIDGET_GALLERY_EXAMPLE_NAME):
+                # Since we start at a 45 degree offset, include it here.
+                degrees = (value.as_float * 180.0) + 45.0
+                radians = math.radians(degrees)
+                self._layout.sources["rotation"].source = RotationSpace(Gf.Vec3d(0, radians, 0))
+                self._layout.components["rotatable_text"].widget.set_label_text(f"{degrees:.2f}")
+                stats.ui_update()
+
+        self._layout = SceneUiLayout(
+            {widget_type.__name__: widget_type for widget_type in (SimpleTextWidget, CountingWidget, SliderWidget)},
+            widget_args={"rotatable_slider": [-1.0, 1.0, __on_rotate]},
+        )
+        added = self._layout.add(panel for panel in panels if not panel.uses_prim_path)
+        get_scene_ui_stats().container_added(WIDGET_GALLERY_EXAMPLE_NAME, added)
+
         async def __wait_one_frame():
             # Wait one frame after creating the Cube as it is not ready.
             await omni.kit.app.get_app().next_update_async()
 
-            parented_widget_component = WidgetComponent(
-                SimpleTextWidget, width=400, height=200, resolution_scale=2, widget_args=["Parented to Cube"]
-            )
-
-            self._parented_widget_container = UiContainer(
-                parented_widget_component,
-                space_stack=[
-                    SpatialSource.new_prim_path_source(cube_prim_path),
-                    SpatialSource.new_translation_source(Gf.Vec3d(0, 100, 0)),
-                ],
-            )
-
-        asyncio.ensure_future(__wait_one_frame())
-
-        # Create two widgets, one text and one slider. The slider causes the text to rotate.
-        # We don't want to create both in a single omni.ui widget because if we don't want to rotate the slider.
-        # Both rotated 45 degrees in yaw to face the user.
-        rotatable_text_widget_component = WidgetComponent(
-            SimpleTextWidget, width=400, height=200, resolution_scale=2, widget_args=["Slide to rotate"]
-        )
-
-        self._rotation_source = SpatialSource.new_rotation_source(Gf.Vec3d(0, 45, 0))
-        self._rotatable_text_widget_container = UiContainer(
-            rotatable_text_widget_component,
-            space_stack=[SpatialSource.new_translation_source(Gf.Vec3d(-600, 350, 0)), self._rotation_source],
-        )
-
-        def __on_rotate(value: ui.AbstractValueModel):
-            # Since we start at a 45 degree offset, include it here.
-            degrees = (value.as_float * 180.0) + 45.0
-            radians = math.radians(degrees)
-            self._rotation_source.source = RotationSpace(Gf.Vec3d(0, radians, 0))
-            rotatable_text_widget_component.widget.set_label_text(f"{degrees:.2f}")
-
-        rotatable_slider_widget_component = WidgetComponent(
-            SliderWidget, width=200, height=200, resolution_scale=2, widget_args=[-1.0, 1.0, __on_rotate]
-        )
+            if self._layout is None:
+                return
+            try:
+                added = self._layout.add(
+                    (panel for panel in panels if panel.uses_prim_path), variables={"cube": cube_prim_path}
+                )
+            except Exception:
+                # Exceptions are otherwise lost inside the future.
+                carb.log_error(traceback.format_exc())
+                return
+            get_scene_ui_stats().container_added(WIDGET_GALLERY_EXAMPLE_NAME, added)
+
+        self._show_task = asyncio.ensure_future(__wait_one_frame())
+
+    def _log_atlas_usage(self, panels: Tuple[PanelSpec, ...]) -> None:
+        """
+        Report how many panels would share a texture atlas page instead of each using a render target of its own.
 
-        self._rotatable_slider_widget_container = UiContainer(
-            rotatable_slider_widget_component,
-            space_stack=[
-                SpatialSource.new_translation_source(Gf.Vec3d(-600, 200, 0)),
-                SpatialSource.new_rotation_source(Gf.Vec3d(0, 45, 0)),
-            ],
+        WidgetComponent always renders to its own texture, so this only plans the atlas to size the saving.
+        """
+        atlas = TextureAtlas()
+        packed = 0
+        for panel in panels:
+            width = int(panel.width * panel.resolution_scale)
+            height = int(panel.height * panel.resolution_scale)
+            if atlas.allocate(width, height):
+                packed += 1
+
+        stats = atlas.stats
+        carb.log_info(
+            f"{WIDGET_GALLERY_EXAMPLE_NAME}: {packed} of {len(panels)} panels would share {stats.pages} atlas "
+            f"page(s), {stats.occupancy:.0%} occupied"
         )